@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Headless preview renderer for the README screenshots in assets/.
+
+Each generated variant is drawn as a mock Zed window (title bar, tabs,
+project panel, editor and status bar) over a sample wallpaper. Blurred
+variants composite their translucent backgrounds over a blurred copy of
+the wallpaper, so the PNGs show the same effect Zed does.
+
+Variants are rendered in parallel across processes and cached by variant
+hash, so only variants whose colors changed are re-rendered.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from theme_utils import Colors, print_step, progress_bar, get_content_hash, positive_int
+
+try:
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+except ImportError:
+    print("Pillow package not found. Installing...")
+    import subprocess
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow"])
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+THEME_PATH = "themes/catppuccin-blur.json"
+ASSETS_DIR = "assets"
+PREVIEW_CACHE_FILE = ".preview_cache.json"
+
+# Bump when the mockup layout changes to invalidate every cached preview
+RENDERER_VERSION = "1"
+
+# Logical window size; SCALE matches the 2x screenshots already in assets/
+WIDTH, HEIGHT = 1512, 982
+SCALE = 2
+BLUR_RADIUS = 40
+
+# Monospace fonts to try before falling back to Pillow's built-in font
+FONT_CANDIDATES = ("DejaVuSansMono.ttf", "Menlo.ttc", "Consolas.ttf")
+
+# Sample wallpaper stops (top-left, top-right, bottom-left, bottom-right)
+WALLPAPERS = {
+    "dark": ["#1e1e2e", "#8839ef", "#04a5e5", "#fe640b"],
+    "light": ["#dce0e8", "#ea76cb", "#7287fd", "#40a02b"],
+}
+
+# Sample source as (syntax token, text) pairs per line
+SAMPLE_CODE = [
+    [("comment", "# Catppuccin Blur preview")],
+    [("keyword", "import"), (None, " "), ("variable", "json")],
+    [],
+    [("keyword", "class"), (None, " "), ("type", "Palette"), ("punctuation.bracket", "("), ("type", "dict"), ("punctuation.bracket", "):")],
+    [(None, "    "), ("string", '"""Map of color names to hex values."""')],
+    [],
+    [(None, "    "), ("keyword", "def"), (None, " "), ("function", "blend"), ("punctuation.bracket", "("),
+     ("variable.special", "self"), ("punctuation.delimiter", ", "), ("variable.parameter", "name"),
+     ("punctuation.delimiter", ", "), ("variable.parameter", "alpha"), ("operator", "="), ("number", "0.85"),
+     ("punctuation.bracket", "):")],
+    [(None, "        "), ("variable", "color"), (None, " "), ("operator", "="), (None, " "), ("variable.special", "self"),
+     ("punctuation.bracket", "["), ("variable.parameter", "name"), ("punctuation.bracket", "]")],
+    [(None, "        "), ("keyword", "if"), (None, " "), ("keyword", "not"), (None, " "),
+     ("variable", "color"), ("punctuation.delimiter", "."), ("function", "startswith"),
+     ("punctuation.bracket", "("), ("string", '"#"'), ("punctuation.bracket", "):")],
+    [(None, "            "), ("keyword", "raise"), (None, " "), ("type", "ValueError"), ("punctuation.bracket", "("),
+     ("string", "f\"bad color: "), ("punctuation.special", "{"), ("variable", "color"), ("punctuation.special", "}"),
+     ("string", "\""), ("punctuation.bracket", ")")],
+    [(None, "        "), ("keyword", "return"), (None, " "), ("variable", "color"), (None, " "), ("operator", "+"),
+     (None, " "), ("function", "format"), ("punctuation.bracket", "("), ("function", "round"),
+     ("punctuation.bracket", "("), ("variable.parameter", "alpha"), (None, " "), ("operator", "*"), (None, " "),
+     ("number", "255"), ("punctuation.bracket", ")"), ("punctuation.delimiter", ", "), ("string", '"02x"'),
+     ("punctuation.bracket", ")")],
+    [],
+    [],
+    [("variable", "MOCHA"), (None, " "), ("operator", "="), (None, " "), ("type", "Palette"), ("punctuation.bracket", "("),
+     ("property", "mauve"), ("operator", "="), ("string", '"#cba6f7"'), ("punctuation.delimiter", ", "),
+     ("property", "base"), ("operator", "="), ("string", '"#1e1e2e"'), ("punctuation.bracket", ")")],
+    [("function", "print"), ("punctuation.bracket", "("), ("variable", "json"), ("punctuation.delimiter", "."),
+     ("function", "dumps"), ("punctuation.bracket", "("), ("variable", "MOCHA"), ("punctuation.delimiter", ", "),
+     ("variable.parameter", "indent"), ("operator", "="), ("number", "2"), ("punctuation.bracket", "))")],
+]
+ACTIVE_LINE = 7
+
+PROJECT_FILES = [
+    (0, "zed-catppuccin-blur"),
+    (1, "assets"),
+    (1, "themes"),
+    (2, "catppuccin-blur.json"),
+    (1, "extension.toml"),
+    (1, "palette.py"),
+    (1, "README.md"),
+    (1, "sync_theme.py"),
+    (1, "theme_overrides.py"),
+]
+SELECTED_FILE = 5
+
+def parse_color(value, default=(0, 0, 0, 0)) -> tuple:
+    """
+    Parse a theme color into an RGBA tuple.
+    Accepts #RRGGBB and #RRGGBBAA, with or without the leading '#'.
+    """
+    if not isinstance(value, str):
+        return default
+    value = value.lstrip("#")
+    if not re.fullmatch(r"[0-9a-fA-F]{6}([0-9a-fA-F]{2})?", value):
+        return default
+    if len(value) == 6:
+        value += "ff"
+    return tuple(int(value[i:i + 2], 16) for i in range(0, 8, 2))
+
+def preview_filename(variant_name: str) -> str:
+    """
+    Map a variant name to its asset filename.
+    "Catppuccin Iced Latte (Blur)" -> "iced-latte.png"
+    "Catppuccin Frappé (Blur) [Heavy]" -> "frappe-heavy.png"
+    """
+    name = unicodedata.normalize("NFKD", variant_name).encode("ascii", "ignore").decode()
+    level = re.search(r"\[(\w+)\]", name)
+    flavor = re.sub(r"\(Blur\)|\[\w+\]", "", name).replace("Catppuccin", "").strip()
+    slug = re.sub(r"[^a-z0-9]+", "-", flavor.lower()).strip("-")
+    if level:
+        slug += f"-{level.group(1).lower()}"
+    return f"{slug}.png"
+
+@lru_cache(maxsize=None)
+def resolve_font() -> str:
+    """Return the path of the first available font, or "default" for Pillow's."""
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, 12).path
+        except OSError:
+            continue
+    return "default"
+
+def variant_hash(variant: dict) -> str:
+    """
+    Hash everything that affects a rendered preview.
+    The resolved font is included because it differs between machines.
+    """
+    content = (json.dumps(variant, sort_keys=True) + RENDERER_VERSION
+               + f"{WIDTH}x{HEIGHT}@{SCALE}" + resolve_font())
+    return get_content_hash(content)
+
+def load_font(size: int):
+    font_path = resolve_font()
+    if font_path != "default":
+        return ImageFont.truetype(font_path, size)
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 only ships a fixed-size bitmap font
+        return ImageFont.load_default()
+
+def make_wallpaper(appearance: str) -> Image.Image:
+    """Build the sample wallpaper: a smooth four-corner gradient."""
+    stops = [parse_color(c) for c in WALLPAPERS.get(appearance, WALLPAPERS["dark"])]
+    corners = Image.new("RGBA", (2, 2))
+    corners.putdata(stops)
+    return corners.resize((WIDTH * SCALE, HEIGHT * SCALE), Image.BICUBIC)
+
+class PreviewCanvas:
+    """Draw in logical coordinates onto a SCALE-sized RGBA image."""
+
+    def __init__(self, image: Image.Image, style: dict):
+        self.image = image
+        self.style = style
+        self.draw = ImageDraw.Draw(image)
+        self.font = load_font(13 * SCALE)
+        self.small_font = load_font(12 * SCALE)
+
+    def color(self, key: str, fallback: str = None) -> tuple:
+        default = parse_color(self.style.get(fallback)) if fallback else (0, 0, 0, 0)
+        return parse_color(self.style.get(key), default)
+
+    def fill(self, box: tuple, color: tuple, radius: int = 0):
+        """Alpha-composite a (possibly translucent) rectangle."""
+        if color[3] == 0:
+            return
+        x0, y0, x1, y1 = (int(v * SCALE) for v in box)
+        layer = Image.new("RGBA", (x1 - x0, y1 - y0), (0, 0, 0, 0))
+        ImageDraw.Draw(layer).rounded_rectangle(
+            (0, 0, x1 - x0 - 1, y1 - y0 - 1), radius * SCALE, fill=color
+        )
+        self.image.alpha_composite(layer, (x0, y0))
+
+    def hline(self, x0: float, x1: float, y: float, color: tuple):
+        self.fill((x0, y, x1, y + 1), color)
+
+    def vline(self, x: float, y0: float, y1: float, color: tuple):
+        self.fill((x, y0, x + 1, y1), color)
+
+    def text(self, xy: tuple, text: str, color: tuple, font=None) -> float:
+        """Draw text and return the logical x position after it."""
+        font = font or self.font
+        x, y = xy[0] * SCALE, xy[1] * SCALE
+        self.draw.text((x, y), text, fill=color, font=font)
+        return xy[0] + self.draw.textlength(text, font=font) / SCALE
+
+def render_preview(variant: dict) -> Image.Image:
+    """Render a variant as a mock Zed window over the sample wallpaper."""
+    style = variant["style"]
+    wallpaper = make_wallpaper(variant.get("appearance", "dark"))
+    image = wallpaper.copy()
+
+    margin = 56
+    window = (margin, margin, WIDTH - margin, HEIGHT - margin)
+    x0, y0, x1, y1 = window
+
+    # Window body: translucent background over the blurred wallpaper
+    crop = tuple(int(v * SCALE) for v in window)
+    behind = wallpaper.crop(crop)
+    if style.get("background.appearance") == "blurred":
+        # Blur at reduced resolution; the result is smooth enough to upscale
+        small = behind.resize((behind.width // 8, behind.height // 8), Image.BILINEAR)
+        small = small.filter(ImageFilter.GaussianBlur(BLUR_RADIUS * SCALE / 8))
+        behind = small.resize(behind.size, Image.BICUBIC)
+    mask = Image.new("L", behind.size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, *behind.size), 12 * SCALE, fill=255)
+    image.paste(behind, crop[:2], mask)
+
+    canvas = PreviewCanvas(image, style)
+    canvas.fill(window, canvas.color("background"), radius=12)
+
+    text = canvas.color("text")
+    muted = canvas.color("text.muted", "text")
+    border = canvas.color("border")
+
+    # Title bar with window controls
+    title_h, status_h, panel_w, tab_h = 38, 28, 250, 34
+    canvas.fill((x0, y0, x1, y0 + title_h), canvas.color("title_bar.background"), radius=12)
+    for i, key in enumerate(("terminal.ansi.red", "terminal.ansi.yellow", "terminal.ansi.green")):
+        cx, cy = x0 + 20 + i * 20, y0 + title_h / 2
+        canvas.fill((cx - 6, cy - 6, cx + 6, cy + 6), canvas.color(key), radius=6)
+    canvas.text((x0 + 90, y0 + 11), "zed-catppuccin-blur", muted, canvas.small_font)
+    canvas.hline(x0, x1, y0 + title_h, border)
+
+    # Status bar
+    canvas.fill((x0, y1 - status_h, x1, y1), canvas.color("status_bar.background"), radius=12)
+    canvas.hline(x0, x1, y1 - status_h, border)
+    canvas.text((x0 + 14, y1 - status_h + 7), variant["name"], muted, canvas.small_font)
+    canvas.text((x1 - 150, y1 - status_h + 7), "Ln 8, Col 28", muted, canvas.small_font)
+
+    # Project panel
+    body_top, body_bottom = y0 + title_h + 1, y1 - status_h
+    canvas.fill((x0, body_top, x0 + panel_w, body_bottom), canvas.color("panel.background"))
+    canvas.vline(x0 + panel_w, body_top, body_bottom, canvas.color("pane_group.border", "border"))
+    for row, (depth, name) in enumerate(PROJECT_FILES):
+        top = body_top + 10 + row * 24
+        if row == SELECTED_FILE:
+            canvas.fill((x0 + 6, top - 3, x0 + panel_w - 6, top + 20),
+                        canvas.color("ghost_element.selected", "element.selected"), radius=4)
+        canvas.text((x0 + 16 + depth * 14, top), name, text if row == SELECTED_FILE else muted)
+
+    # Tab bar
+    editor_x = x0 + panel_w + 1
+    canvas.fill((editor_x, body_top, x1, body_top + tab_h), canvas.color("tab_bar.background"))
+    tabs = [("palette.py", True), ("sync_theme.py", False)]
+    tab_x = editor_x
+    for name, active in tabs:
+        tab_w = 150
+        key = "tab.active_background" if active else "tab.inactive_background"
+        canvas.fill((tab_x, body_top, tab_x + tab_w, body_top + tab_h), canvas.color(key))
+        canvas.text((tab_x + 18, body_top + 9), name, text if active else muted)
+        canvas.vline(tab_x + tab_w, body_top, body_top + tab_h, border)
+        tab_x += tab_w + 1
+    canvas.hline(editor_x, x1, body_top + tab_h, border)
+
+    # Editor
+    editor_top = body_top + tab_h + 1
+    canvas.fill((editor_x, editor_top, x1, body_bottom), canvas.color("editor.background"))
+    gutter_w = 56
+    canvas.fill((editor_x, editor_top, editor_x + gutter_w, body_bottom),
+                canvas.color("editor.gutter.background"))
+
+    syntax = style.get("syntax", {})
+    foreground = canvas.color("editor.foreground", "text")
+    line_h = 22
+    for i, tokens in enumerate(SAMPLE_CODE):
+        top = editor_top + 12 + i * line_h
+        if i == ACTIVE_LINE:
+            canvas.fill((editor_x, top - 3, x1, top + line_h - 3),
+                        canvas.color("editor.active_line.background"))
+            canvas.fill((editor_x, top - 3, x1, top + line_h - 3),
+                        canvas.color("editor.highlighted_line.background"))
+        number_key = "editor.active_line_number" if i == ACTIVE_LINE else "editor.line_number"
+        number = str(i + 1)
+        number_w = canvas.draw.textlength(number, font=canvas.font) / SCALE
+        canvas.text((editor_x + gutter_w - 14 - number_w, top), number, canvas.color(number_key))
+
+        x = editor_x + gutter_w + 12
+        for token, chunk in tokens:
+            color = foreground
+            while token:
+                if token in syntax and syntax[token].get("color"):
+                    color = parse_color(syntax[token]["color"], foreground)
+                    break
+                token = token.rpartition(".")[0]
+            x = canvas.text((x, top), chunk, color)
+
+        if i == ACTIVE_LINE:
+            players = style.get("players") or [{}]
+            cursor = parse_color(players[0].get("cursor"), foreground)
+            canvas.fill((x, top - 1, x + 2, top + 17), cursor)
+
+    # Scrollbar thumb
+    canvas.fill((x1 - 12, editor_top + 8, x1 - 4, editor_top + 160),
+                canvas.color("scrollbar.thumb.background"), radius=4)
+
+    return image.convert("RGB")
+
+def render_to_file(variant: dict, output_path: str) -> str:
+    """Process pool worker: render a variant and save it as PNG."""
+    render_preview(variant).save(output_path, optimize=True)
+    return output_path
+
+def load_cache() -> dict:
+    if os.path.exists(PREVIEW_CACHE_FILE):
+        with open(PREVIEW_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+def save_cache(cache: dict):
+    with open(PREVIEW_CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+def render_all(theme: dict, output_dir: str = ASSETS_DIR, jobs: int = None, force: bool = False) -> tuple:
+    """
+    Render previews for every variant in the theme family.
+    Variants whose hash matches the cache and whose PNG exists are skipped
+    unless force is set. Cache entries for other outputs are kept.
+    A failed render is reported and skipped; the cache keeps every preview
+    that did complete. Returns (rendered, failed) lists of output paths.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache = load_cache()
+
+    pending = {}
+    for variant in theme["themes"]:
+        output_path = os.path.join(output_dir, preview_filename(variant["name"]))
+        digest = variant_hash(variant)
+        if not force and cache.get(output_path) == digest and os.path.exists(output_path):
+            continue
+        pending[output_path] = (variant, digest)
+
+    skipped = len(theme["themes"]) - len(pending)
+    if skipped:
+        print_step(f"{skipped} previews unchanged - using cache", "info")
+    if not pending:
+        return [], []
+
+    print_step(f"Rendering {len(pending)} previews...", "processing")
+    rendered, failed = [], []
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(render_to_file, variant, output_path): output_path
+                for output_path, (variant, _) in pending.items()
+            }
+            for future in as_completed(futures):
+                output_path = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print()
+                    print_step(f"Failed to render {output_path}: {str(e)}", "error")
+                    failed.append(output_path)
+                else:
+                    cache[output_path] = pending[output_path][1]
+                    rendered.append(output_path)
+                progress_bar(len(rendered) + len(failed), len(pending), "  Rendering")
+    finally:
+        save_cache(cache)
+
+    return sorted(rendered), sorted(failed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Render theme preview screenshots.")
+    parser.add_argument("--theme", default=THEME_PATH, help="generated theme file to render")
+    parser.add_argument("--output-dir", default=ASSETS_DIR, help="directory for the PNG previews")
+    parser.add_argument("--jobs", type=positive_int, default=None, help="number of render processes")
+    parser.add_argument("--force", action="store_true", help="ignore the cache and re-render everything")
+    args = parser.parse_args()
+
+    start_time = time.time()
+
+    try:
+        with open(args.theme, 'r') as f:
+            theme = json.load(f)
+
+        rendered, failed = render_all(theme, args.output_dir, args.jobs, args.force)
+
+        elapsed = time.time() - start_time
+        if failed:
+            print(f"\n{Colors.RED}✗ Failed to render {len(failed)} previews{Colors.RESET}")
+            print(f"{Colors.DIM}   • Rendered: {len(rendered)}{Colors.RESET}")
+            print(f"{Colors.DIM}   • Time: {elapsed:.2f}s{Colors.RESET}\n")
+            sys.exit(1)
+
+        print(f"\n{Colors.GREEN}{'═' * 50}{Colors.RESET}")
+        print(f"{Colors.GREEN}✨ Previews up to date!{Colors.RESET}")
+        print(f"{Colors.DIM}   • Rendered: {len(rendered)}{Colors.RESET}")
+        print(f"{Colors.DIM}   • Time: {elapsed:.2f}s{Colors.RESET}")
+        print(f"{Colors.DIM}   • Output: {args.output_dir}{Colors.RESET}")
+        print(f"{Colors.GREEN}{'═' * 50}{Colors.RESET}\n")
+
+    except KeyboardInterrupt:
+        print(f"\n\n{Colors.YELLOW}⚠{Colors.RESET}  Operation cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n{Colors.RED}✗ Failed to render previews:{Colors.RESET} {str(e)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
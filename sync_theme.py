@@ -1,13 +1,31 @@
 #!/usr/bin/env python3
+"""
+Command line interface for syncing Catppuccin Blur with upstream Catppuccin.
+
+Subcommands:
+    build     Fetch upstream, apply blur overrides and write the theme (default)
+    validate  Validate a generated theme file against the Zed schema
+    diff      Show which variants and style keys a build would change
+    bench     Time the generate, validate and serialize stages
+    watch     Rebuild whenever theme_overrides.py changes
+
+The theme transforms live in theme_engine.py and can be imported directly.
+"""
+import argparse
+import asyncio
+import importlib
 import json
 import requests
 import os
-import re
 import sys
 import time
 import hashlib
-from theme_overrides import THEME_OVERRIDES, VARIANT_MAP, BLUR_LEVELS, BASE_THEME_OVERRIDES
+import theme_engine
+import theme_overrides
+from theme_utils import Colors, print_step, get_file_hash, positive_int, get_content_hash
+from theme_engine import SCHEMA_URL, ThemeEngine, diff_themes, parse_theme, serialize_theme
 
+# Not used directly; ensures jsonschema is installed before theme_engine needs it
 try:
     import jsonschema
 except ImportError:
@@ -16,143 +34,78 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "jsonschema"])
     import jsonschema
 
-# ANSI color codes
-class Colors:
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    PURPLE = '\033[95m'
-    CYAN = '\033[96m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-
 # URLs
 THEME_URL = "https://raw.githubusercontent.com/catppuccin/zed/main/themes/catppuccin-mauve.json"
-SCHEMA_URL = "https://zed.dev/schema/themes/v0.2.0.json"
 SCHEMA_CACHE_FILE = ".theme_schema_cache.json"
+OUTPUT_PATH = "themes/catppuccin-blur.json"
+
+COMMANDS = ("build", "validate", "diff", "bench", "watch")
+
+# Max variants buffered between pipeline stages
+PIPELINE_QUEUE_SIZE = 4
 
 def print_header():
     print(f"\n{Colors.PURPLE}╭{'─' * 48}╮{Colors.RESET}")
     print(f"{Colors.PURPLE}│{Colors.RESET} {Colors.BOLD}🎨 Catppuccin Blur Theme Sync{Colors.RESET}{'  ' * 9}{Colors.PURPLE}│{Colors.RESET}")
     print(f"{Colors.PURPLE}╰{'─' * 48}╯{Colors.RESET}\n")
 
-def print_step(step: str, status: str = "info"):
-    icons = {
-        "info": f"{Colors.BLUE}ℹ{Colors.RESET}",
-        "success": f"{Colors.GREEN}✓{Colors.RESET}",
-        "error": f"{Colors.RED}✗{Colors.RESET}",
-        "warning": f"{Colors.YELLOW}⚠{Colors.RESET}",
-        "processing": f"{Colors.CYAN}◆{Colors.RESET}"
-    }
-    print(f"{icons.get(status, icons['info'])} {step}")
-
-def progress_bar(current: int, total: int, prefix: str = "", width: int = 30):
-    percent = current / total
-    filled = int(width * percent)
-    bar = f"{'█' * filled}{'░' * (width - filled)}"
-
-    sys.stdout.write(f"\r{prefix} {Colors.CYAN}[{bar}]{Colors.RESET} {percent:.0%}")
-    sys.stdout.flush()
-
-    if current == total:
-        print()  # New line when complete
-
-def get_file_hash(filepath: str) -> str:
-    """Calculate SHA256 hash of a file."""
-    if not os.path.exists(filepath):
-        return ""
-
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
-
-def get_content_hash(content: str) -> str:
-    """Calculate SHA256 hash of string content."""
-    return hashlib.sha256(content.encode()).hexdigest()
-
-def fetch_schema() -> dict:
+def is_url(source: str) -> bool:
+    return source.startswith(("http://", "https://"))
+
+def fetch_schema(source: str = SCHEMA_URL, cache_file: str = SCHEMA_CACHE_FILE) -> dict:
     """
     Fetch and cache the Zed theme schema.
     Cache expires after 7 days to ensure we stay up-to-date.
     Falls back to cached version if network request fails.
+    A local file path is read directly, without caching.
     """
-    if os.path.exists(SCHEMA_CACHE_FILE):
-        cache_age = time.time() - os.path.getmtime(SCHEMA_CACHE_FILE)
+    if not is_url(source):
+        print_step(f"Loading theme schema from {source}", "info")
+        with open(source, 'r') as f:
+            return json.load(f)
+
+    if os.path.exists(cache_file):
+        cache_age = time.time() - os.path.getmtime(cache_file)
         if cache_age < 7 * 24 * 60 * 60:
             print_step("Using cached theme schema", "info")
-            with open(SCHEMA_CACHE_FILE, 'r') as f:
+            with open(cache_file, 'r') as f:
                 return json.load(f)
 
     print_step("Fetching theme schema...", "processing")
     try:
-        response = requests.get(SCHEMA_URL)
+        response = requests.get(source)
         response.raise_for_status()
         schema = response.json()
 
-        with open(SCHEMA_CACHE_FILE, 'w') as f:
+        with open(cache_file, 'w') as f:
             json.dump(schema, f, indent=2)
 
         print_step("Theme schema fetched and cached", "success")
         return schema
     except Exception as e:
         print_step(f"Failed to fetch schema: {str(e)}", "warning")
-        if os.path.exists(SCHEMA_CACHE_FILE):
+        if os.path.exists(cache_file):
             print_step("Falling back to cached schema", "info")
-            with open(SCHEMA_CACHE_FILE, 'r') as f:
+            with open(cache_file, 'r') as f:
                 return json.load(f)
         return None
 
-def validate_theme(theme: dict, schema: dict) -> bool:
-    """Validate theme against the Zed schema."""
-    if not schema:
-        print_step("Skipping validation - no schema available", "warning")
-        return True
-
-    try:
-        jsonschema.validate(instance=theme, schema=schema)
-        print_step("Theme validation passed", "success")
-        return True
-    except jsonschema.ValidationError as e:
-        print_step(f"Theme validation failed: {e.message}", "error")
-        print(f"{Colors.DIM}  Path: {'.'.join(str(p) for p in e.path)}{Colors.RESET}")
-        return False
-    except Exception as e:
-        print_step(f"Validation error: {str(e)}", "error")
-        return False
-
-def fix_json(json_str):
-    """
-    Fix common JSON syntax errors in theme files.
-    Removes trailing commas before closing brackets/braces.
-    """
-    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-    return json_str
-
-def remove_alpha(color):
-    """
-    Remove alpha channel from hex colors.
-    #RRGGBBAA -> #RRGGBB
-    """
-    if isinstance(color, str) and color.startswith('#'):
-        if len(color) == 9:
-            return color[:-2]
-        elif len(color) == 6:
-            return color
-    return color
-
-def fetch_theme():
+def fetch_theme(source: str = THEME_URL, show_progress: bool = True) -> dict:
     """
     Download the upstream Catppuccin theme from GitHub.
-    Shows animated spinner during download with file size progress.
+    Shows animated spinner during download with file size progress,
+    unless show_progress is False (e.g. while other fetches print).
+    A local file path is read directly.
     """
+    if not is_url(source):
+        print_step(f"Loading theme from {source}", "info")
+        with open(source, 'r') as f:
+            return parse_theme(f.read())
+
     print_step("Fetching theme from upstream...", "processing")
 
     try:
-        response = requests.get(THEME_URL, stream=True)
+        response = requests.get(source, stream=True)
         response.raise_for_status()
 
         block_size = 8192
@@ -165,20 +118,22 @@ def fetch_theme():
         for data in response.iter_content(block_size):
             content.append(data)
             downloaded += len(data)
+            if not show_progress:
+                continue
 
             sys.stdout.write(f"\r  {Colors.CYAN}{spinner[spinner_idx]}{Colors.RESET} Downloading... ({downloaded / 1024:.1f} KB)")
             sys.stdout.flush()
             spinner_idx = (spinner_idx + 1) % len(spinner)
 
-        print()
+        if show_progress:
+            print()
 
         full_content = b''.join(content).decode('utf-8')
 
         print_step(f"Download complete! ({downloaded / 1024:.1f} KB)", "success")
         print_step("Parsing theme data...", "processing")
 
-        fixed_json = fix_json(full_content)
-        theme_data = json.loads(fixed_json)
+        theme_data = parse_theme(full_content)
 
         print_step("Theme data parsed successfully", "success")
         return theme_data
@@ -190,210 +145,327 @@ def fetch_theme():
         print_step(f"Failed to parse theme JSON: {str(e)}", "error")
         raise
 
-def apply_blur(theme, generate_all_levels=False):
+def print_validation_error(name: str, error):
+    path = list(error.path)
+    if path[:1] == ["themes"]:
+        # Variant errors are reported relative to the variant
+        path = path[2:]
+    target = f" for {name}" if name else ""
+    print_step(f"Theme validation failed{target}: {error.message}", "error")
+    print(f"{Colors.DIM}  Path: {'.'.join(str(p) for p in path)}{Colors.RESET}")
+
+def validate_theme(theme: dict, engine: ThemeEngine) -> bool:
+    """Validate a theme family and its variants against the Zed schema."""
+    if engine.validator is None:
+        print_step("Skipping validation - no schema available", "warning")
+        return True
+
+    errors = engine.validate(theme)
+    for name, error in errors:
+        print_validation_error(name, error)
+    if errors:
+        return False
+    print_step("Theme validation passed", "success")
+    return True
+
+class StreamingThemeWriter:
+    """
+    Write a theme family to disk one variant at a time.
+
+    Output is byte-identical to json.dumps(theme, indent=2). Content is
+    written to a temporary file next to the target and only moved into
+    place by commit() when its hash differs from the existing file.
+    """
+
+    def __init__(self, output_path: str, theme: dict):
+        self.output_path = output_path
+        self.theme = theme
+        self.tmp_path = f"{output_path}.tmp"
+        self.variant_count = 0
+        self._member_count = 0
+        self._hash = hashlib.sha256()
+        self._file = None
+
+    def _write(self, text: str):
+        self._file.write(text)
+        self._hash.update(text.encode())
+
+    @staticmethod
+    def _indent(value, depth: int) -> str:
+        return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
+
+    def _write_member(self, key: str, value: str):
+        separator = ",\n" if self._member_count else "\n"
+        self._write(f"{separator}  {json.dumps(key)}: {value}")
+        self._member_count += 1
+
+    def open(self):
+        """Write everything up to the opening bracket of the themes array."""
+        keys = list(self.theme)
+        self._themes_index = keys.index("themes")
+        self._file = open(self.tmp_path, "w")
+        self._write("{")
+        for key in keys[:self._themes_index]:
+            self._write_member(key, self._indent(self.theme[key], 1))
+        self._write_member("themes", "[")
+
+    def write_variant(self, variant: dict):
+        separator = ",\n" if self.variant_count else "\n"
+        self._write(f"{separator}    {self._indent(variant, 2)}")
+        self.variant_count += 1
+
+    def close(self):
+        """Close the themes array and write any remaining members."""
+        self._write("\n  ]" if self.variant_count else "]")
+        for key in list(self.theme)[self._themes_index + 1:]:
+            self._write_member(key, self._indent(self.theme[key], 1))
+        self._write("\n}")
+        self._file.close()
+        self._file = None
+
+    def commit(self) -> bool:
+        """Move the written file into place. Returns False if nothing changed."""
+        if get_file_hash(self.output_path) == self._hash.hexdigest():
+            os.remove(self.tmp_path)
+            return False
+        os.replace(self.tmp_path, self.output_path)
+        return True
+
+    def discard(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+async def load_engine(theme_source: str = THEME_URL, schema_source: str = SCHEMA_URL) -> ThemeEngine:
     """
-    Apply blur modifications to the Catppuccin theme.
-    Creates Espresso variants and applies custom overrides to all variants.
+    Fetch the schema and upstream theme concurrently.
+    The download spinner is disabled so schema messages stay on their own lines.
+    """
+    schema, upstream = await asyncio.gather(
+        asyncio.to_thread(fetch_schema, schema_source),
+        asyncio.to_thread(fetch_theme, theme_source, False),
+    )
+    return ThemeEngine(upstream, schema)
 
-    Args:
-        theme: The theme data to modify
-        generate_all_levels: If True, generates all blur level variants
+async def run_pipeline(engine: ThemeEngine, output_path: str) -> tuple:
     """
-    print_step("Applying blur modifications...", "processing")
-
-    # Store original themes to create variants from
-    original_themes = theme["themes"].copy()
-    new_themes = []
-
-    print_step("Creating custom variants...", "processing")
-    macchiato_theme = None
-    latte_theme = None
-    for theme_variant in original_themes:
-        if "macchiato" in theme_variant["name"].lower():
-            macchiato_theme = theme_variant.copy()
-        elif "latte" in theme_variant["name"].lower():
-            latte_theme = theme_variant.copy()
-
-    # Create Iced Latte variants
-    if latte_theme:
-        print_step("Creating Iced Latte variants...", "processing")
-        for level_name, level_config in BLUR_LEVELS.items():
-            iced_theme = latte_theme.copy()
-            iced_theme["name"] = f"Catppuccin Iced Latte"
-            iced_theme["appearance"] = "light"
-            
-            iced_style = latte_theme["style"].copy()
-            iced_overrides = BASE_THEME_OVERRIDES["iced_latte"].copy()
-            
-            # Apply blur level to iced latte overrides
-            from theme_overrides import generate_theme_overrides_for_level
-            level_overrides = generate_theme_overrides_for_level(iced_overrides, level_config)
-            
-            for k, v in level_overrides.items():
-                iced_style[k] = v
-            
-            iced_theme["style"] = iced_style
-            
-            if level_name == "medium":
-                iced_theme["name"] = "Catppuccin Iced Latte (Blur)"
-            else:
-                iced_theme["name"] = f"Catppuccin Iced Latte (Blur) [{level_name.capitalize()}]"
-            
-            new_themes.append(iced_theme)
-        
-        print_step("Iced Latte variants created", "success")
-
-    if macchiato_theme:
-        # Add Espresso to base overrides for all blur levels
-        for level_name, level_config in BLUR_LEVELS.items():
-            espresso_theme = macchiato_theme.copy()
-            espresso_theme["name"] = f"Catppuccin Espresso"
-            espresso_theme["appearance"] = "dark"
-
-            espresso_style = macchiato_theme["style"].copy()
-            espresso_overrides = BASE_THEME_OVERRIDES["espresso"].copy()
-
-            # Apply blur level to espresso overrides
-            from theme_overrides import generate_theme_overrides_for_level
-            level_overrides = generate_theme_overrides_for_level(espresso_overrides, level_config)
-
-            for k, v in level_overrides.items():
-                espresso_style[k] = v
-
-            espresso_theme["style"] = espresso_style
-
-            if level_name == "medium":
-                # Use original name for medium blur
-                espresso_theme["name"] = "Catppuccin Espresso (Blur)"
-            else:
-                # Use bracketed name for light/heavy
-                espresso_theme["name"] = f"Catppuccin Espresso (Blur) [{level_name.capitalize()}]"
-
-            new_themes.append(espresso_theme)
-
-        print_step("Espresso variants created", "success")
-
-    print(f"\n{Colors.BOLD}Generating all blur level variants:{Colors.RESET}")
-
-    # Create variants for each blur level
-    for level_name, level_config in BLUR_LEVELS.items():
-        print(f"\n  {Colors.PURPLE}◆{Colors.RESET} Creating {Colors.BOLD}{level_name.capitalize()}{Colors.RESET} blur variants...")
-
-        for original_theme in original_themes:
-            variant_name = original_theme["name"].lower()
-
-            # Find matching base variant
-            for name, key_prefix in VARIANT_MAP.items():
-                base_key = key_prefix.replace("_medium", "")  # Remove _medium suffix
-                if name in variant_name:
-                    new_theme = original_theme.copy()
-
-                    # Original name for medium blur, bracketed names for others
-                    if level_name == "medium":
-                        new_theme["name"] = f"{original_theme['name']} (Blur)"
-                    else:
-                        new_theme["name"] = f"{original_theme['name']} (Blur) [{level_name.capitalize()}]"
-
-                    style = new_theme["style"].copy()
-                    override_key = f"{base_key}_{level_name}"
-
-                    if override_key in THEME_OVERRIDES:
-                        overrides = THEME_OVERRIDES[override_key]
-                        for k, v in overrides.items():
-                            style[k] = v
-
-                        new_theme["style"] = style
-                        new_themes.append(new_theme)
-                        print(f"    {Colors.GREEN}✓{Colors.RESET} {original_theme['name']} ({level_name})")
-                    break
-
-    # Replace theme variants with new ones
-    theme["themes"] = new_themes
-
-    print(f"\n{Colors.GREEN}✓{Colors.RESET} All blur modifications applied successfully!")
-    return theme
-
-def main():
+    Generate, validate and write the theme, one variant at a time.
+
+    Variants stream from generation through validation into the writer over
+    bounded queues, so the full theme is never serialized in one piece. Each
+    stage has a single consumer, so variant order (and the output file) is
+    the same as a serial run. These stages are CPU-bound and run on the
+    event loop, so they interleave rather than run in parallel; the latency
+    win comes from fetching the schema and theme concurrently (load_engine).
+
+    Returns a (changed, variant_count) tuple.
+    """
+    family = engine.family()
+    if engine.validator is None:
+        print_step("Skipping validation - no schema available", "warning")
+
+    generated = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    validated = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    writer = StreamingThemeWriter(output_path, family)
+
+    async def generate():
+        for variant in engine.variants():
+            await generated.put(variant)
+        await generated.put(None)
+
+    async def validate():
+        while (variant := await generated.get()) is not None:
+            error = engine.check_variant(variant, family)
+            if error is not None:
+                print_validation_error(variant["name"], error)
+                raise ValueError("Theme validation failed - aborting")
+            await validated.put(variant)
+        await validated.put(None)
+
+    async def write():
+        writer.open()
+        while (variant := await validated.get()) is not None:
+            writer.write_variant(variant)
+            print(f"    {Colors.GREEN}✓{Colors.RESET} {variant['name']}")
+        writer.close()
+
+    tasks = [asyncio.ensure_future(stage()) for stage in (generate, validate, write)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        writer.discard()
+        raise
+
+    return writer.commit(), writer.variant_count
+
+def print_summary(color: str, title: str, details: list):
+    print(f"\n{color}{'═' * 50}{Colors.RESET}")
+    print(f"{color}{title}{Colors.RESET}")
+    for detail in details:
+        print(f"{Colors.DIM}   • {detail}{Colors.RESET}")
+    print(f"{color}{'═' * 50}{Colors.RESET}\n")
+
+def cmd_build(args) -> int:
     print_header()
 
     start_time = time.time()
 
-    output_path = "themes/catppuccin-blur.json"
+    # Create output directory
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    print_step("Initialized output directory", "success")
 
-    # Create themes directory
-    os.makedirs("themes", exist_ok=True)
-    print_step("Initialized themes directory", "success")
+    print()
+    engine = asyncio.run(load_engine(args.input, args.schema))
 
-    # Get hash of existing file
-    existing_hash = get_file_hash(output_path)
+    print(f"\n{Colors.BOLD}Generating blur variants:{Colors.RESET}")
+    changed, variant_count = asyncio.run(run_pipeline(engine, args.output))
+    if engine.validator is not None:
+        print_step("Theme validation passed", "success")
 
-    try:
-        print()
-        schema = fetch_schema()
-
-        print()
-        theme = fetch_theme()
-        print()
-        theme = apply_blur(theme, True)
-
-        print(f"\n{Colors.BOLD}Finalizing theme:{Colors.RESET}")
-        print_step("Updating theme metadata...", "processing")
-
-        theme["name"] = "Catppuccin Blur"
-        theme["author"] = "Jens Lystad <jens@lystad.io>"
-        theme["$schema"] = SCHEMA_URL
-        variant_count = len(theme["themes"])
-
-        print_step(f"Updated {variant_count} variant names", "success")
-
-        # Validate theme before saving
-        print(f"\n{Colors.BOLD}Validating theme:{Colors.RESET}")
-        if not validate_theme(theme, schema):
-            print_step("Theme validation failed - aborting", "error")
-            sys.exit(1)
-
-        # Generate new content
-        new_content = json.dumps(theme, indent=2)
-        new_hash = get_content_hash(new_content)
-
-        # Check if content has changed
-        if existing_hash == new_hash:
-            print_step("No changes detected - theme is already up to date!", "info")
-
-            # Summary for no changes
-            elapsed = time.time() - start_time
-            print(f"\n{Colors.BLUE}{'═' * 50}{Colors.RESET}")
-            print(f"{Colors.BLUE}ℹ Theme is already up to date{Colors.RESET}")
-            print(f"{Colors.DIM}   • No changes required{Colors.RESET}")
-            print(f"{Colors.DIM}   • Time: {elapsed:.2f}s{Colors.RESET}")
-            print(f"{Colors.DIM}   • Output: {output_path}{Colors.RESET}")
-            print(f"{Colors.BLUE}{'═' * 50}{Colors.RESET}\n")
-            return
-
-        # Save theme if changes detected
-        print_step("Changes detected - updating theme file...", "processing")
-
-        with open(output_path, "w") as f:
-            f.write(new_content)
-
-        # Calculate file size
-        file_size = os.path.getsize(output_path) / 1024  # KB
-        print_step(f"Theme saved to {Colors.BOLD}{output_path}{Colors.RESET} ({file_size:.1f} KB)", "success")
-
-        # Summary
-        elapsed = time.time() - start_time
-        print(f"\n{Colors.GREEN}{'═' * 50}{Colors.RESET}")
-        print(f"{Colors.GREEN}✨ Theme synchronization complete!{Colors.RESET}")
-        print(f"{Colors.DIM}   • Variants: {variant_count}{Colors.RESET}")
-        print(f"{Colors.DIM}   • Time: {elapsed:.2f}s{Colors.RESET}")
-        print(f"{Colors.DIM}   • Output: {output_path}{Colors.RESET}")
-        print(f"{Colors.GREEN}{'═' * 50}{Colors.RESET}\n")
+    elapsed = time.time() - start_time
+    if not changed:
+        print_step("No changes detected - theme is already up to date!", "info")
+        print_summary(Colors.BLUE, "ℹ Theme is already up to date",
+                      ["No changes required", f"Time: {elapsed:.2f}s", f"Output: {args.output}"])
+        return 0
+
+    # Calculate file size
+    file_size = os.path.getsize(args.output) / 1024  # KB
+    print_step(f"Theme saved to {Colors.BOLD}{args.output}{Colors.RESET} ({file_size:.1f} KB)", "success")
+    print_summary(Colors.GREEN, "✨ Theme synchronization complete!",
+                  [f"Variants: {variant_count}", f"Time: {elapsed:.2f}s", f"Output: {args.output}"])
+    return 0
+
+def cmd_validate(args) -> int:
+    with open(args.path, 'r') as f:
+        theme = json.load(f)
+    engine = ThemeEngine(theme, fetch_schema(args.schema))
+    return 0 if validate_theme(theme, engine) else 1
+
+def cmd_diff(args) -> int:
+    """Exit status is 1 when the build would change the output file."""
+    engine = ThemeEngine(fetch_theme(args.input))
+    new_theme = engine.build()
+
+    existing = {}
+    if os.path.exists(args.output):
+        with open(args.output, 'r') as f:
+            existing = json.load(f)
+
+    result = diff_themes(existing, new_theme)
+    print()
+    for name in result["added"]:
+        print(f"  {Colors.GREEN}+{Colors.RESET} {name}")
+    for name in result["removed"]:
+        print(f"  {Colors.RED}-{Colors.RESET} {name}")
+    for name, keys in result["changed"].items():
+        print(f"  {Colors.YELLOW}~{Colors.RESET} {name} ({len(keys)} keys)")
+        for key in keys:
+            print(f"      {Colors.DIM}{key}{Colors.RESET}")
+
+    if get_file_hash(args.output) == get_content_hash(serialize_theme(new_theme)):
+        print_step("No changes - theme is already up to date", "info")
+        return 0
+    if not any(result.values()):
+        print_step("Only metadata or formatting would change", "info")
+    return 1
+
+def cmd_bench(args) -> int:
+    start = time.perf_counter()
+    engine = asyncio.run(load_engine(args.input, args.schema))
+    load_time = time.perf_counter() - start
+
+    timings = {"generate": [], "validate": [], "serialize": []}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        theme = engine.build()
+        timings["generate"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        engine.validate(theme)
+        timings["validate"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        serialize_theme(theme)
+        timings["serialize"].append(time.perf_counter() - start)
+
+    print(f"\n{Colors.BOLD}Benchmark ({args.repeat} runs, {len(theme['themes'])} variants):{Colors.RESET}")
+    print(f"  {'load':<10} {load_time * 1000:>9.1f} ms")
+    for stage, samples in timings.items():
+        best = min(samples) * 1000
+        mean = sum(samples) / len(samples) * 1000
+        print(f"  {stage:<10} {best:>9.1f} ms  {Colors.DIM}(mean {mean:.1f} ms){Colors.RESET}")
+    return 0
+
+def cmd_watch(args) -> int:
+    """Rebuild on every change to theme_overrides.py, reusing the loaded engine."""
+    engine = asyncio.run(load_engine(args.input, args.schema))
+    overrides_path = theme_overrides.__file__
+    last_mtime = None
+
+    print_step(f"Watching {overrides_path} for changes (Ctrl+C to stop)", "info")
+    while True:
+        mtime = os.path.getmtime(overrides_path)
+        if mtime != last_mtime:
+            reload = last_mtime is not None
+            last_mtime = mtime
+            try:
+                if reload:
+                    # Module globals are updated in place, so the engine picks up the new overrides
+                    importlib.reload(theme_overrides)
+                    importlib.reload(theme_engine)
+                print(f"\n{Colors.BOLD}Rebuilding ({time.strftime('%H:%M:%S')}):{Colors.RESET}")
+                changed, variant_count = asyncio.run(run_pipeline(engine, args.output))
+                status = f"Wrote {variant_count} variants to {args.output}" if changed else "No changes"
+                print_step(status, "success")
+            except Exception as e:
+                print_step(f"Rebuild failed: {str(e)}", "error")
+        time.sleep(args.interval)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sync Catppuccin Blur with upstream Catppuccin.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    def add_command(name, func, help_text, input=True, schema=True, output=True):
+        sub = subparsers.add_parser(name, help=help_text, description=help_text)
+        if input:
+            sub.add_argument("--input", default=THEME_URL, help="upstream theme URL or file")
+        if schema:
+            sub.add_argument("--schema", default=SCHEMA_URL, help="Zed theme schema URL or file")
+        if output:
+            sub.add_argument("--output", default=OUTPUT_PATH, help="generated theme file")
+        sub.set_defaults(func=func)
+        return sub
+
+    add_command("build", cmd_build, "Build the theme and write it if it changed")
+    validate = add_command("validate", cmd_validate, "Validate a generated theme file", input=False, output=False)
+    validate.add_argument("path", nargs="?", default=OUTPUT_PATH, help="theme file to validate")
+    add_command("diff", cmd_diff, "Show what a build would change", schema=False)
+    bench = add_command("bench", cmd_bench, "Time the build stages", output=False)
+    bench.add_argument("--repeat", type=positive_int, default=10, help="number of timed runs")
+    watch = add_command("watch", cmd_watch, "Rebuild when theme_overrides.py changes")
+    watch.add_argument("--interval", type=float, default=1.0, help="polling interval in seconds")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        # Running the script without a subcommand builds, as before
+        argv = ["build", *argv]
+    args = parser.parse_args(argv)
 
+    try:
+        sys.exit(args.func(args))
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}⚠{Colors.RESET}  Operation cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n{Colors.RED}✗ Failed to update theme:{Colors.RESET} {str(e)}")
+        print(f"\n{Colors.RED}✗ Failed to {args.command} theme:{Colors.RESET} {str(e)}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+import pytest
+
+BLUR_LEVELS = {
+    "light": {"main": "99", "surface": "8c", "elements": "80", "active": "90"},
+    "medium": {"main": "d7", "surface": "d0", "elements": "a0", "active": "b0"},
+    "heavy": {"main": "e0", "surface": "db", "elements": "c0", "active": "d0"},
+}
+
+BASE_COLORS = {
+    "latte": "#f9fafc",
+    "iced_latte": "#ffffff",
+    "frappe": "#303446",
+    "macchiato": "#24273a",
+    "mocha": "#1e1e2e",
+    "espresso": "#000000",
+}
+
+def make_upstream() -> dict:
+    themes = []
+    for flavor in ("Latte", "Frappé", "Macchiato", "Mocha"):
+        themes.append({
+            "name": f"Catppuccin {flavor}",
+            "appearance": "light" if flavor == "Latte" else "dark",
+            "style": {
+                "background": "#1e1e2e",
+                "text": "#cdd6f4",
+                "syntax": {"comment": {"color": "#9399b2ff", "font_style": None}},
+                "players": [{"cursor": "#f5e0dc"}],
+            },
+        })
+    return {"$schema": "x", "name": "Catppuccin", "author": "c", "themes": themes}
+
+def make_base_overrides() -> dict:
+    return {
+        variant: {
+            "background.appearance": "blurred",
+            "background": f"{color}d7",
+            "surface.background": f"{color}d0",
+            "tab.active_background": f"{color}60",
+            "scrollbar.thumb.background": f"{color}30",
+            "ghost_element.hover": f"{color}90",
+        }
+        for variant, color in BASE_COLORS.items()
+    }
+
+@pytest.fixture
+def upstream():
+    return make_upstream()
+
+@pytest.fixture
+def base_overrides():
+    return make_base_overrides()
+
+@pytest.fixture
+def blur_levels():
+    return BLUR_LEVELS
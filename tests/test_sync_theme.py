@@ -0,0 +1,37 @@
+import pytest
+
+from sync_theme import StreamingThemeWriter
+from theme_engine import build_theme, serialize_theme
+
+def write_streaming(path, theme):
+    family = {k: [] if k == "themes" else v for k, v in theme.items()}
+    writer = StreamingThemeWriter(str(path), family)
+    writer.open()
+    for variant in theme["themes"]:
+        writer.write_variant(variant)
+    writer.close()
+    assert writer.commit()
+    return path.read_text()
+
+@pytest.mark.parametrize("variant_count", [0, 1, 18])
+def test_streaming_writer_matches_serialize_theme(tmp_path, upstream, variant_count):
+    theme = build_theme(upstream)
+    theme["themes"] = theme["themes"][:variant_count]
+    assert write_streaming(tmp_path / "theme.json", theme) == serialize_theme(theme)
+
+def test_streaming_writer_handles_members_after_themes(tmp_path, upstream):
+    theme = {"name": "Catppuccin Blur", "themes": build_theme(upstream)["themes"][:2], "extra": {"a": [1, 2]}}
+    assert write_streaming(tmp_path / "theme.json", theme) == serialize_theme(theme)
+
+def test_streaming_writer_skips_unchanged_file(tmp_path, upstream):
+    theme = build_theme(upstream)
+    path = tmp_path / "theme.json"
+    path.write_text(serialize_theme(theme))
+
+    writer = StreamingThemeWriter(str(path), {**theme, "themes": []})
+    writer.open()
+    for variant in theme["themes"]:
+        writer.write_variant(variant)
+    writer.close()
+    assert not writer.commit()
+    assert not (tmp_path / "theme.json.tmp").exists()
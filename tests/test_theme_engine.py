@@ -0,0 +1,91 @@
+import copy
+import os
+
+from theme_engine import ThemeEngine, build_theme, diff_themes, generate_variants, serialize_theme
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["name", "themes"],
+    "properties": {
+        "name": {"type": "string"},
+        "themes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "style"],
+                "properties": {"appearance": {"enum": ["light", "dark"]}},
+            },
+        },
+    },
+}
+
+def test_build_matches_golden_file(upstream, base_overrides, blur_levels):
+    # Golden file generated by the pre-library apply_blur with the same config
+    with open(os.path.join(FIXTURES, "catppuccin-blur.json")) as f:
+        expected = f.read()
+    assert serialize_theme(build_theme(upstream, base_overrides, blur_levels)) == expected
+
+def test_generate_variants_order(upstream, base_overrides, blur_levels):
+    names = [v["name"] for v in generate_variants(upstream["themes"], base_overrides, blur_levels)]
+    flavors = ["Latte", "Frappé", "Macchiato", "Mocha"]
+    assert names == [
+        "Catppuccin Iced Latte (Blur) [Light]",
+        "Catppuccin Iced Latte (Blur)",
+        "Catppuccin Iced Latte (Blur) [Heavy]",
+        "Catppuccin Espresso (Blur) [Light]",
+        "Catppuccin Espresso (Blur)",
+        "Catppuccin Espresso (Blur) [Heavy]",
+        *[f"Catppuccin {flavor} (Blur) [Light]" for flavor in flavors],
+        *[f"Catppuccin {flavor} (Blur)" for flavor in flavors],
+        *[f"Catppuccin {flavor} (Blur) [Heavy]" for flavor in flavors],
+    ]
+
+def test_build_does_not_share_state_with_upstream(upstream):
+    original = copy.deepcopy(upstream)
+    engine = ThemeEngine(upstream)
+
+    first = engine.build()
+    for variant in first["themes"]:
+        variant["style"]["syntax"]["comment"]["color"] = "#ff0000ff"
+        variant["style"]["players"].append({"cursor": "#ff0000"})
+
+    second = engine.build()
+    assert upstream == original
+    assert len(second["themes"]) == 18
+    for variant in second["themes"]:
+        assert variant["style"]["syntax"]["comment"]["color"] == "#9399b2ff"
+        assert len(variant["style"]["players"]) == 1
+
+def test_diff_themes(upstream):
+    old = build_theme(upstream)
+    new = copy.deepcopy(old)
+    removed = new["themes"].pop(0)["name"]
+    new["themes"].append({"name": "Catppuccin Test", "style": {}})
+    new["themes"][0]["style"]["border"] = "#ffffff"
+    new["themes"][0]["style"].pop("text")
+
+    assert diff_themes(old, new) == {
+        "added": ["Catppuccin Test"],
+        "removed": [removed],
+        "changed": {new["themes"][0]["name"]: ["border", "text"]},
+    }
+    assert diff_themes(old, old) == {"added": [], "removed": [], "changed": {}}
+
+def test_validate_reports_invalid_metadata_without_variants():
+    theme = {"name": 5, "themes": []}
+    errors = ThemeEngine(theme, SCHEMA).validate(theme)
+    assert len(errors) == 1
+    assert errors[0][0] is None
+    assert list(errors[0][1].path) == ["name"]
+
+def test_validate_reports_each_error_once(upstream):
+    theme = build_theme(upstream)
+    theme["name"] = 5
+    theme["themes"][2]["appearance"] = "dim"
+
+    errors = ThemeEngine(theme, SCHEMA).validate(theme)
+    assert [name for name, _ in errors] == [None, theme["themes"][2]["name"]]
+    assert list(errors[1][1].path) == ["themes", 2, "appearance"]
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Library API for building Catppuccin Blur themes.
+
+Everything here is pure: functions take the upstream theme and override
+config and return new data, without network access, file I/O or printing.
+sync_theme.py wraps this module with fetching, progress output and the CLI.
+
+Tools that build themes repeatedly should keep a ThemeEngine around, which
+holds the parsed upstream theme and compiled schema validator between calls.
+"""
+import copy
+import json
+import re
+from theme_overrides import BASE_THEME_OVERRIDES, BLUR_LEVELS, VARIANT_MAP, generate_theme_overrides_for_level
+
+SCHEMA_URL = "https://zed.dev/schema/themes/v0.2.0.json"
+THEME_NAME = "Catppuccin Blur"
+THEME_AUTHOR = "Jens Lystad <jens@lystad.io>"
+
+# Base override keys for the variants derived from an upstream flavor
+CUSTOM_VARIANTS = {
+    "iced_latte": ("latte", "Catppuccin Iced Latte", "light"),
+    "espresso": ("macchiato", "Catppuccin Espresso", "dark"),
+}
+
+def fix_json(json_str):
+    """
+    Fix common JSON syntax errors in theme files.
+    Removes trailing commas before closing brackets/braces.
+    """
+    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
+    return json_str
+
+def parse_theme(content: str) -> dict:
+    """Parse upstream theme JSON, tolerating trailing commas."""
+    return json.loads(fix_json(content))
+
+def remove_alpha(color):
+    """
+    Remove alpha channel from hex colors.
+    #RRGGBBAA -> #RRGGBB
+    """
+    if isinstance(color, str) and color.startswith('#'):
+        if len(color) == 9:
+            return color[:-2]
+        elif len(color) == 6:
+            return color
+    return color
+
+def blur_variant_name(name: str, level_name: str) -> str:
+    """Original name plus (Blur) for medium, bracketed level for the others."""
+    if level_name == "medium":
+        return f"{name} (Blur)"
+    return f"{name} (Blur) [{level_name.capitalize()}]"
+
+def make_variant(base: dict, name: str, overrides: dict, appearance: str = None) -> dict:
+    """
+    Return a deep copy of base with a new name and overrides applied to its style.
+    Nothing is shared with base, so variants can be edited independently.
+    """
+    variant = copy.deepcopy(base)
+    variant["name"] = name
+    if appearance:
+        variant["appearance"] = appearance
+    variant["style"].update(overrides)
+    return variant
+
+def generate_variants(original_themes, base_overrides=None, blur_levels=None):
+    """
+    Yield blur variants of the upstream themes one at a time, in output order.
+    Creates Iced Latte and Espresso variants first, then every upstream
+    flavor at each blur level. The upstream themes are not modified.
+
+    Args:
+        original_themes: The upstream "themes" list
+        base_overrides: Per-variant overrides, defaults to BASE_THEME_OVERRIDES
+        blur_levels: Alpha values per blur level, defaults to BLUR_LEVELS
+    """
+    base_overrides = BASE_THEME_OVERRIDES if base_overrides is None else base_overrides
+    blur_levels = BLUR_LEVELS if blur_levels is None else blur_levels
+
+    flavors = {}
+    for theme_variant in original_themes:
+        for flavor in ("macchiato", "latte"):
+            if flavor in theme_variant["name"].lower():
+                flavors[flavor] = theme_variant
+                break
+
+    for key, (flavor, name, appearance) in CUSTOM_VARIANTS.items():
+        if flavor not in flavors or key not in base_overrides:
+            continue
+        for level_name, level_config in blur_levels.items():
+            overrides = generate_theme_overrides_for_level(base_overrides[key], level_config)
+            yield make_variant(flavors[flavor], blur_variant_name(name, level_name), overrides, appearance)
+
+    for level_name, level_config in blur_levels.items():
+        for original_theme in original_themes:
+            variant_name = original_theme["name"].lower()
+
+            # Find matching base variant
+            for name, key_prefix in VARIANT_MAP.items():
+                base_key = key_prefix.replace("_medium", "")  # Remove _medium suffix
+                if name in variant_name:
+                    if base_key in base_overrides:
+                        overrides = generate_theme_overrides_for_level(base_overrides[base_key], level_config)
+                        yield make_variant(original_theme, blur_variant_name(original_theme["name"], level_name), overrides)
+                    break
+
+def theme_family(upstream: dict, schema_url: str = SCHEMA_URL) -> dict:
+    """
+    Return the theme family metadata with an empty themes list.
+    Key order follows the upstream file so serialized output stays stable.
+    """
+    family = {k: [] if k == "themes" else copy.deepcopy(v) for k, v in upstream.items()}
+    family["name"] = THEME_NAME
+    family["author"] = THEME_AUTHOR
+    family["$schema"] = schema_url
+    family["themes"] = []
+    return family
+
+def build_theme(upstream: dict, base_overrides=None, blur_levels=None, schema_url: str = SCHEMA_URL) -> dict:
+    """Build the complete Catppuccin Blur theme family from the upstream theme."""
+    family = theme_family(upstream, schema_url)
+    family["themes"] = list(generate_variants(upstream["themes"], base_overrides, blur_levels))
+    return family
+
+def serialize_theme(theme: dict) -> str:
+    """Serialize a theme family exactly as it is written to disk."""
+    return json.dumps(theme, indent=2)
+
+def make_variant_validator(schema: dict):
+    """
+    Compile the Zed schema once so variants can be validated one at a time.
+    Returns None when no schema is available.
+    """
+    if not schema:
+        return None
+    import jsonschema
+    validator_cls = jsonschema.validators.validator_for(schema)
+    return validator_cls(schema)
+
+def check_variant(variant: dict, family: dict, validator):
+    """
+    Validate a single variant against the Zed schema.
+    The variant is wrapped in the theme family metadata so the top-level
+    schema applies unchanged. Returns the ValidationError, or None if valid.
+    """
+    if validator is None:
+        return None
+    import jsonschema
+
+    wrapped = {k: v for k, v in family.items() if k != "themes"}
+    wrapped["themes"] = [variant]
+    return jsonschema.exceptions.best_match(validator.iter_errors(wrapped))
+
+def diff_themes(old: dict, new: dict) -> dict:
+    """
+    Compare two theme families variant by variant.
+    Returns added and removed variant names, and for changed variants the
+    style keys whose values differ.
+    """
+    old_variants = {v["name"]: v for v in old.get("themes", [])}
+    new_variants = {v["name"]: v for v in new.get("themes", [])}
+
+    changed = {}
+    for name, variant in new_variants.items():
+        if name not in old_variants or old_variants[name] == variant:
+            continue
+        old_style = old_variants[name].get("style", {})
+        new_style = variant.get("style", {})
+        keys = sorted(k for k in old_style.keys() | new_style.keys() if old_style.get(k) != new_style.get(k))
+        changed[name] = keys or sorted(k for k in variant if old_variants[name].get(k) != variant.get(k))
+
+    return {
+        "added": [name for name in new_variants if name not in old_variants],
+        "removed": [name for name in old_variants if name not in new_variants],
+        "changed": changed,
+    }
+
+class ThemeEngine:
+    """
+    Reusable build state for in-process callers.
+
+    Holds the parsed upstream theme and the compiled schema validator, so
+    repeated builds (e.g. after editing overrides) skip re-downloading and
+    re-compiling. Override config can be swapped between builds.
+    """
+
+    def __init__(self, upstream: dict, schema: dict = None, base_overrides=None, blur_levels=None,
+                 schema_url: str = SCHEMA_URL):
+        self.upstream = upstream
+        self.schema = schema
+        self.base_overrides = base_overrides
+        self.blur_levels = blur_levels
+        self.schema_url = schema_url
+        self._validator = None
+
+    @property
+    def validator(self):
+        if self._validator is None:
+            self._validator = make_variant_validator(self.schema)
+        return self._validator
+
+    def family(self) -> dict:
+        return theme_family(self.upstream, self.schema_url)
+
+    def variants(self):
+        return generate_variants(self.upstream["themes"], self.base_overrides, self.blur_levels)
+
+    def build(self) -> dict:
+        return build_theme(self.upstream, self.base_overrides, self.blur_levels, self.schema_url)
+
+    def check_variant(self, variant: dict, family: dict = None):
+        return check_variant(variant, family or self.family(), self.validator)
+
+    def validate(self, theme: dict) -> list:
+        """
+        Validate the whole theme family against the Zed schema.
+        Returns (variant name, ValidationError) pairs, with the best error for
+        the family metadata first (name None), then one per invalid variant.
+        """
+        if self.validator is None:
+            return []
+        import jsonschema
+
+        grouped = {}
+        for error in self.validator.iter_errors(theme):
+            path = list(error.path)
+            index = path[1] if path[:1] == ["themes"] and len(path) > 1 else None
+            grouped.setdefault(index, []).append(error)
+
+        errors = []
+        if None in grouped:
+            errors.append((None, jsonschema.exceptions.best_match(grouped.pop(None))))
+        for index in sorted(grouped):
+            errors.append((theme["themes"][index].get("name"), jsonschema.exceptions.best_match(grouped[index])))
+        return errors
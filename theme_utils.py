@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Console output and hashing helpers shared by the sync and preview scripts.
+
+Kept free of network and schema dependencies so worker processes can
+import it cheaply.
+"""
+import argparse
+import hashlib
+import os
+import sys
+
+# ANSI color codes
+class Colors:
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    PURPLE = '\033[95m'
+    CYAN = '\033[96m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+    DIM = '\033[2m'
+
+def print_step(step: str, status: str = "info"):
+    icons = {
+        "info": f"{Colors.BLUE}ℹ{Colors.RESET}",
+        "success": f"{Colors.GREEN}✓{Colors.RESET}",
+        "error": f"{Colors.RED}✗{Colors.RESET}",
+        "warning": f"{Colors.YELLOW}⚠{Colors.RESET}",
+        "processing": f"{Colors.CYAN}◆{Colors.RESET}"
+    }
+    print(f"{icons.get(status, icons['info'])} {step}")
+
+def progress_bar(current: int, total: int, prefix: str = "", width: int = 30):
+    percent = current / total
+    filled = int(width * percent)
+    bar = f"{'█' * filled}{'░' * (width - filled)}"
+
+    sys.stdout.write(f"\r{prefix} {Colors.CYAN}[{bar}]{Colors.RESET} {percent:.0%}")
+    sys.stdout.flush()
+
+    if current == total:
+        print()  # New line when complete
+
+def get_file_hash(filepath: str) -> str:
+    """Calculate SHA256 hash of a file."""
+    if not os.path.exists(filepath):
+        return ""
+
+    sha256_hash = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for byte_block in iter(lambda: f.read(4096), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+def get_content_hash(content: str) -> str:
+    """Calculate SHA256 hash of string content."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number